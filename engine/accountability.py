@@ -34,7 +34,7 @@ def _canonical_json(payload: Dict[str, Any]) -> str:
     return json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictionPayload:
     """Structured payload saved before hashing."""
 
@@ -84,7 +84,7 @@ class PredictionPayload:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictionRecord:
     """Immutable prediction record stored on disk."""
 
@@ -109,7 +109,7 @@ class PredictionRecord:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationRecord:
     """Outcome record for a prediction once reality catches up."""
 
@@ -159,6 +159,8 @@ class PredictionTracker:
         self.verifications_dir.mkdir(parents=True, exist_ok=True)
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        # hash -> file, built lazily by one directory walk instead of a glob per lookup
+        self._path_index: Optional[Dict[str, List[Path]]] = None
 
     # ------------------------------------------------------------------
     # Minting predictions
@@ -187,6 +189,8 @@ class PredictionTracker:
 
         with path.open("w", encoding="utf-8") as f:
             json.dump(record_data, f, ensure_ascii=False, indent=2)
+        if self._path_index is not None:
+            self._path_index.setdefault(digest, []).append(path)
 
         self._append_log(
             {
@@ -332,16 +336,17 @@ class PredictionTracker:
             "shame_wall": shame_wall,
         }
 
+        # Encode once, write each copy in a single call
+        encoded = json.dumps(ledger, ensure_ascii=False, indent=2)
+
         path = Path(output_path) if output_path else self.ledger_path
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(ledger, f, ensure_ascii=False, indent=2)
+        path.write_text(encoded, encoding="utf-8")
 
         # Mirror to docs for public GET (no auth)
         docs_path = Path("docs/prediction-ledger.json")
         docs_path.parent.mkdir(parents=True, exist_ok=True)
-        with docs_path.open("w", encoding="utf-8") as f:
-            json.dump(ledger, f, ensure_ascii=False, indent=2)
+        docs_path.write_text(encoded, encoding="utf-8")
 
         return ledger
 
@@ -353,8 +358,20 @@ class PredictionTracker:
         with self.log_path.open("a", encoding="utf-8") as f:
             f.write(json.dumps(event, ensure_ascii=False) + "\n")
 
+    def _build_path_index(self) -> Dict[str, List[Path]]:
+        index: Dict[str, List[Path]] = {}
+        for file_path in self.predictions_dir.glob("**/*.json"):
+            index.setdefault(file_path.stem, []).append(file_path)
+        self._path_index = index
+        return index
+
     def _find_prediction_file(self, prediction_hash: str) -> Optional[Path]:
-        candidates = list(self.predictions_dir.glob(f"**/{prediction_hash}.json"))
+        fresh = self._path_index is None
+        index = self._build_path_index() if fresh else self._path_index
+        candidates = index.get(prediction_hash)
+        if not candidates and not fresh:
+            # Files minted by another process since the index was built.
+            candidates = self._build_path_index().get(prediction_hash)
         if not candidates:
             return None
         if len(candidates) > 1:
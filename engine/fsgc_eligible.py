@@ -3,7 +3,7 @@
 
 import json
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
@@ -336,9 +336,12 @@ def generate_enhanced_report():
             country = loc.split(":")[0]
             country_stats[country] = country_stats.get(country, 0) + 1
     
+    # Un solo timestamp UTC per generated_at e nome del file d'archivio
+    now = datetime.now(timezone.utc)
+
     # Genera report con campo eligible_found per Telegram
     report = {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": now.replace(tzinfo=None).isoformat() + "Z",
         "source": "FSGC-DiasporaHunter-v4",
         "eligible_found": len(targets),  # IMPORTANTE per Telegram alert
         "based_on": "Real San Marino diaspora research",
@@ -369,7 +372,7 @@ def generate_enhanced_report():
         json.dump(report, f, ensure_ascii=False, indent=2)
     
     # File con data per archivio
-    date_file = docs_dir / f"fsgc_eligible_{datetime.now().strftime('%Y-%m-%d')}.json"
+    date_file = docs_dir / f"fsgc_eligible_{now.strftime('%Y-%m-%d')}.json"
     with open(date_file, 'w', encoding='utf-8') as f:
         json.dump(report, f, ensure_ascii=False, indent=2)
     
@@ -32,7 +32,7 @@ REGION_BASE_VALUE = {
 TIMEFRAME_DAYS = 180  # 6 months horizon for value calls
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateSignal:
     player_id: str
     player_name: str
@@ -328,13 +328,12 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
 def main(argv: Optional[Sequence[str]] = None) -> None:
     args = parse_args(argv)
     tracker = PredictionTracker()
-    poster = XPoster()
-    engine = PredictionEngine(tracker=tracker, poster=poster)
-
     as_of = None
     if args.as_of:
         as_of = datetime.fromisoformat(args.as_of.replace("Z", "+00:00"))
-    result = engine.run(limit=args.limit, as_of=as_of, dry_run=args.dry_run)
+    with XPoster() as poster:
+        engine = PredictionEngine(tracker=tracker, poster=poster)
+        result = engine.run(limit=args.limit, as_of=as_of, dry_run=args.dry_run)
 
     print(json.dumps({"status": "ok", "predictions": len(result.get("predictions", []))}))
 
@@ -14,16 +14,20 @@ through text-only tooling.
 from __future__ import annotations
 
 import argparse
-import io
+import glob
 import re
 import textwrap
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from html.parser import HTMLParser
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     """Container for a single action card rendered in the executive report."""
 
@@ -31,7 +35,7 @@ class Card:
     paragraphs: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportContent:
     """Structured representation of the HTML report."""
 
@@ -48,29 +52,36 @@ class ReportHTMLParser(HTMLParser):
     def __init__(self) -> None:
         super().__init__()
         self.content = ReportContent()
-        self._tag_stack: List[tuple[str, dict[str, str]]] = []
+        self._tag_stack: List[tuple[str, str]] = []
         self._active_buffer: Optional[List[str]] = None
         self._active_target: Optional[tuple[str, Optional[int]]] = None
-        self._card_stack: List[int] = []
+        # Cards never nest in the report template, so only the open card is tracked.
+        self._current_card: Optional[int] = None
         self._pending_link: Optional[str] = None
 
     # -- HTMLParser hooks -------------------------------------------------
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
-        attributes = {name: value or "" for name, value in attrs}
-        self._tag_stack.append((tag, attributes))
-
-        if tag == "div" and "class" in attributes and "card" in attributes["class"].split():
+        # Only ``class`` and ``href`` are ever consulted, so skip building a dict.
+        css_class = ""
+        href = None
+        for name, value in attrs:
+            if name == "class":
+                css_class = value or ""
+            elif name == "href":
+                href = value
+        self._tag_stack.append((tag, css_class))
+
+        if tag == "div" and "card" in css_class.split():
             self.content.cards.append(Card())
-            self._card_stack.append(len(self.content.cards) - 1)
+            self._current_card = len(self.content.cards) - 1
         elif tag == "h1":
             self._begin_buffer("heading")
         elif tag == "p":
-            css_class = attributes.get("class", "")
             if "section-title" in css_class.split():
                 self._begin_buffer("section_title")
-            elif self._card_stack:
-                self._begin_buffer("card_paragraph", self._card_stack[-1])
+            elif self._current_card is not None:
+                self._begin_buffer("card_paragraph", self._current_card)
             else:
                 self._begin_buffer("paragraph")
         elif tag == "ul":
@@ -78,10 +89,10 @@ class ReportHTMLParser(HTMLParser):
             pass
         elif tag == "li":
             self._begin_buffer("bullet")
-        elif tag == "h3" and self._card_stack:
-            self._begin_buffer("card_title", self._card_stack[-1])
+        elif tag == "h3" and self._current_card is not None:
+            self._begin_buffer("card_title", self._current_card)
         elif tag == "a":
-            self._pending_link = attributes.get("href") or None
+            self._pending_link = href or None
 
     def handle_endtag(self, tag: str) -> None:
         if tag == "a" and self._pending_link and self._active_buffer is not None:
@@ -91,13 +102,13 @@ class ReportHTMLParser(HTMLParser):
         if self._active_target is not None and self._matches_active_tag(tag):
             self._commit_buffer()
 
-        popped_tag, popped_attrs = self._tag_stack.pop()
+        popped_tag, popped_class = self._tag_stack.pop()
         if popped_tag != tag:
             # HTMLParser already guarantees nesting, but fail loudly if something slips.
             raise RuntimeError(f"Unexpected closing tag order: expected {popped_tag}, got {tag}")
 
-        if popped_tag == "div" and "class" in popped_attrs and "card" in popped_attrs["class"].split():
-            self._card_stack.pop()
+        if popped_tag == "div" and "card" in popped_class.split():
+            self._current_card = None
 
     def handle_data(self, data: str) -> None:
         if self._active_buffer is not None:
@@ -155,10 +166,46 @@ class ReportHTMLParser(HTMLParser):
     @staticmethod
     def _normalise_text(raw: str) -> str:
         # Collapse whitespace while keeping intentional spacing around punctuation.
-        collapsed = re.sub(r"\s+", " ", raw).strip()
         # The HTML occasionally uses arrows; normalise them into ASCII for portability.
-        collapsed = collapsed.replace("→", "->")
-        return collapsed
+        return " ".join(raw.split()).replace("→", "->")
+
+
+# Text-showing operator for a single line; bytes %-formatting skips the str.format
+# parser and the later ASCII re-encode of every page stream. Font size and x are
+# fixed within a block, so that head is formatted once and cached per pair.
+_LINE_HEAD_FMT = b"BT /F1 %.2f Tf 1 0 0 1 %.2f "
+_LINE_TAIL_FMT = b"%.2f Tm (%s) Tj ET\n"
+
+
+@lru_cache(maxsize=None)
+def _line_head(font_size: float, x: float) -> bytes:
+    return _LINE_HEAD_FMT % (font_size, x)
+
+
+# Bytes that need escaping inside a PDF string literal: ( ) \ and anything
+# outside printable ASCII. Most report lines contain none of them.
+_PDF_ESCAPE_RE = re.compile(rb"[^\x20-\x27\x2a-\x5b\x5d-\x7e]")
+
+
+# Replacement for every byte value, so escaping a match is a single lookup:
+# ( ) \ get a backslash, everything else the regex matches an octal escape.
+_ESCAPED_BYTES = [
+    b"\\%c" % byte if byte in (0x28, 0x29, 0x5C) else b"\\%03o" % byte for byte in range(256)
+]
+
+
+def _escape_byte(match: re.Match) -> bytes:
+    return _ESCAPED_BYTES[match.group()[0]]
+
+
+# Object dictionaries are pure ASCII, so they are kept as bytes templates and
+# filled with %-formatting instead of formatting a str and encoding it.
+_PAGES_FMT = b"<< /Type /Pages /Kids [%s] /Count %d >>"
+_PAGE_FMT = (
+    b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents %d 0 R "
+    b"/Resources << /Font << /F1 %d 0 R >> >> >>"
+)
+_FONT_OBJECT = b"<< /Type /Font /Subtype /Type1 /Name /F1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
 
 
 class SimplePDF:
@@ -172,9 +219,11 @@ class SimplePDF:
     BOTTOM_MARGIN = 60.0
 
     def __init__(self) -> None:
-        self._pages: List[List[str]] = [[]]
+        self._pages: List[List[bytes]] = [[]]
         self._page_index = 0
         self._cursor_y = self.PAGE_HEIGHT - self.TOP_MARGIN
+        # (font size, indent) -> characters per line; only a handful of pairs occur.
+        self._line_capacity: dict[tuple[float, float], int] = {}
 
     # -- Public layout helpers ------------------------------------------
 
@@ -202,11 +251,11 @@ class SimplePDF:
         for paragraph in card.paragraphs:
             self._add_text_block(paragraph, font_size=12, indent=16.0, spacing_before=0, spacing_after=6)
 
-    def render(self) -> bytes:
+    def render(self, compress: bool = False) -> bytes:
         if not self._pages:
             self._pages.append([])
 
-        page_streams = ["".join(commands).encode("ascii") for commands in self._pages]
+        page_streams = [b"".join(commands) for commands in self._pages]
         page_count = len(page_streams)
         if page_count == 0:
             page_streams = [b""]
@@ -216,57 +265,45 @@ class SimplePDF:
         font_object_number = 3 + page_count
         content_object_numbers = [font_object_number + 1 + i for i in range(page_count)]
 
-        kids_entries = " ".join(f"{num} 0 R" for num in page_object_numbers)
+        kids_entries = b" ".join(b"%d 0 R" % num for num in page_object_numbers)
 
         objects: List[bytes] = [
             b"<< /Type /Catalog /Pages 2 0 R >>",
-            "<< /Type /Pages /Kids [{kids}] /Count {count} >>".format(
-                kids=kids_entries,
-                count=page_count,
-            ).encode("ascii"),
+            _PAGES_FMT % (kids_entries, page_count),
         ]
-
-        for page_num, (page_obj_num, content_obj_num) in enumerate(
-            zip(page_object_numbers, content_object_numbers),
-            start=1,
-        ):
-            objects.append(
-                (
-                    "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents {content} 0 R "
-                    "/Resources << /Font << /F1 {font} 0 R >> >> >>"
-                ).format(content=content_obj_num, font=font_object_number).encode("ascii")
-            )
-
-        objects.append(
-            b"<< /Type /Font /Subtype /Type1 /Name /F1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
-        )
+        objects.extend(_PAGE_FMT % (content_obj_num, font_object_number) for content_obj_num in content_object_numbers)
+        objects.append(_FONT_OBJECT)
 
         for stream in page_streams:
-            objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+            if compress:
+                # Binary output: smaller, but no longer diffable as text.
+                stream = zlib.compress(stream, 9)
+                header = b"<< /Length %d /Filter /FlateDecode >>"
+            else:
+                header = b"<< /Length %d >>"
+            objects.append(header % len(stream) + b"\nstream\n" + stream + b"\nendstream")
 
-        buffer = io.BytesIO()
-        buffer.write(b"%PDF-1.4\n%OB1 Radar ASCII PDF\n")
+        # A single growable buffer keeps object offsets as plain ``len`` lookups.
+        buffer = bytearray(b"%PDF-1.4\n%OB1 Radar ASCII PDF\n")
 
         offsets = [0]
         for index, obj in enumerate(objects, start=1):
-            offsets.append(buffer.tell())
-            buffer.write(f"{index} 0 obj\n".encode("ascii"))
-            buffer.write(obj)
+            offsets.append(len(buffer))
+            buffer += b"%d 0 obj\n" % index
+            buffer += obj
             if not obj.endswith(b"\n"):
-                buffer.write(b"\n")
-            buffer.write(b"endobj\n")
+                buffer += b"\n"
+            buffer += b"endobj\n"
 
-        xref_start = buffer.tell()
-        buffer.write(f"xref\n0 {len(objects) + 1}\n".encode("ascii"))
-        buffer.write(b"0000000000 65535 f \n")
+        xref_start = len(buffer)
+        buffer += b"xref\n0 %d\n" % (len(objects) + 1)
+        buffer += b"0000000000 65535 f \n"
         for offset in offsets[1:]:
-            buffer.write(f"{offset:010d} 00000 n \n".encode("ascii"))
-        buffer.write(b"trailer\n")
-        buffer.write(f"<< /Size {len(objects) + 1} /Root 1 0 R >>\n".encode("ascii"))
-        buffer.write(b"startxref\n")
-        buffer.write(str(xref_start).encode("ascii"))
-        buffer.write(b"\n%%EOF\n")
-        return buffer.getvalue()
+            buffer += b"%010d 00000 n \n" % offset
+        buffer += b"trailer\n"
+        buffer += b"<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+        buffer += b"startxref\n%d\n%%%%EOF\n" % xref_start
+        return bytes(buffer)
 
     # -- Internal layout helpers ----------------------------------------
 
@@ -290,13 +327,16 @@ class SimplePDF:
         )
 
     def _wrap_text(self, text: str, font_size: float, indent_points: float = 0.0) -> List[str]:
-        usable_width = self.PAGE_WIDTH - self.LEFT_MARGIN - self.RIGHT_MARGIN - indent_points
-        if usable_width <= 0:
+        key = (font_size, indent_points)
+        chars_per_line = self._line_capacity.get(key)
+        if chars_per_line is None:
+            usable_width = self.PAGE_WIDTH - self.LEFT_MARGIN - self.RIGHT_MARGIN - indent_points
+            # Approximate character width for Helvetica; 0 marks a block with no room.
+            chars_per_line = max(10, int(usable_width / (font_size * 0.5))) if usable_width > 0 else 0
+            self._line_capacity[key] = chars_per_line
+        if not chars_per_line:
             return []
-        # Approximate character width for Helvetica.
-        chars_per_line = max(10, int(usable_width / (font_size * 0.5)))
-        wrapped = textwrap.wrap(text, width=chars_per_line)
-        return wrapped
+        return _wrap_words(text, chars_per_line)
 
     def _write_lines(
         self,
@@ -307,23 +347,17 @@ class SimplePDF:
         spacing_after: float,
     ) -> None:
         leading = font_size * 1.3
+        head = _line_head(font_size, self.LEFT_MARGIN + indent)
         y = self._cursor_y - spacing_before
         for line in lines:
             if y < self.BOTTOM_MARGIN:
                 self._new_page()
                 y = self._cursor_y - spacing_before
-            self._current_page_commands().append(
-                "BT /F1 {size:.2f} Tf 1 0 0 1 {x:.2f} {y:.2f} Tm ({text}) Tj ET\n".format(
-                    size=font_size,
-                    x=self.LEFT_MARGIN + indent,
-                    y=y,
-                    text=self._escape_text(line),
-                )
-            )
+            self._current_page_commands().append(head + _LINE_TAIL_FMT % (y, self._escape_text(line)))
             y -= leading
         self._cursor_y = y - spacing_after
 
-    def _current_page_commands(self) -> List[str]:
+    def _current_page_commands(self) -> List[bytes]:
         return self._pages[self._page_index]
 
     def _new_page(self) -> None:
@@ -334,26 +368,57 @@ class SimplePDF:
         self._cursor_y = self.PAGE_HEIGHT - self.TOP_MARGIN
 
     @staticmethod
-    def _escape_text(text: str) -> str:
+    @lru_cache(maxsize=4096)
+    def _escape_text(text: str) -> bytes:
         encoded = text.encode("cp1252", errors="replace")
-        escaped_chars = []
-        for byte in encoded:
-            if byte in (0x28, 0x29, 0x5C):  # (, ), \
-                escaped_chars.append(f"\\{chr(byte)}")
-            elif 32 <= byte <= 126:
-                escaped_chars.append(chr(byte))
-            else:
-                escaped_chars.append(f"\\{byte:03o}")
-        return "".join(escaped_chars)
+        if _PDF_ESCAPE_RE.search(encoded) is None:
+            return encoded
+        return _PDF_ESCAPE_RE.sub(_escape_byte, encoded)
+
+
+def _wrap_words(text: str, width: int) -> List[str]:
+    """Greedy word wrap that matches ``textwrap.wrap`` on single-spaced text.
+
+    Text with hyphens (which ``textwrap`` may split on), irregular spacing or
+    words longer than ``width`` is handed to ``textwrap`` unchanged.
+    """
+
+    words = text.split()
+    if not words:
+        return []
+    if "-" in text or text != " ".join(words):
+        return textwrap.wrap(text, width=width)
+    if len(text) <= width:
+        return [text]
+    if max(map(len, words)) > width:
+        return textwrap.wrap(text, width=width)
+
+    lines: List[str] = []
+    line = words[0]
+    for word in words[1:]:
+        if len(line) + 1 + len(word) <= width:
+            line += " " + word
+        else:
+            lines.append(line)
+            line = word
+    lines.append(line)
+    return lines
+
+
+_FEED_CHUNK_CHARS = 64 * 1024
 
 
 def parse_report(html_path: Path) -> ReportContent:
     parser = ReportHTMLParser()
-    parser.feed(html_path.read_text(encoding="utf-8"))
+    # HTMLParser is incremental, so the file is fed in chunks instead of one string.
+    with html_path.open("r", encoding="utf-8") as handle:
+        while chunk := handle.read(_FEED_CHUNK_CHARS):
+            parser.feed(chunk)
+    parser.close()
     return parser.content
 
 
-def build_pdf(html_path: Path, pdf_path: Path) -> None:
+def build_pdf(html_path: Path, pdf_path: Path, compress: bool = False) -> None:
     html_path = html_path.resolve()
     pdf_path = pdf_path.resolve()
 
@@ -369,8 +434,29 @@ def build_pdf(html_path: Path, pdf_path: Path) -> None:
     for card in content.cards:
         pdf.add_card(card)
 
+    rendered = pdf.render(compress=compress)
+    # Leave an identical PDF untouched so its mtime (and any deploy of it) is not churned.
+    if pdf_path.is_file() and pdf_path.read_bytes() == rendered:
+        return
     pdf_path.parent.mkdir(parents=True, exist_ok=True)
-    pdf_path.write_bytes(pdf.render())
+    pdf_path.write_bytes(rendered)
+
+
+def build_pdfs(pairs: Sequence[Tuple[Path, Path]], compress: bool = False) -> None:
+    """Render several reports, in parallel worker processes when there is more than one.
+
+    Each build is independent and CPU-bound, so a process pool sidesteps the GIL.
+    """
+
+    if len(pairs) < 2:
+        for html_path, pdf_path in pairs:
+            build_pdf(html_path, pdf_path, compress=compress)
+        return
+    html_paths = [html_path for html_path, _ in pairs]
+    pdf_paths = [pdf_path for _, pdf_path in pairs]
+    with ProcessPoolExecutor() as executor:
+        # Consume the iterator so a failing report raises here.
+        list(executor.map(build_pdf, html_paths, pdf_paths, repeat(compress)))
 
 
 def parse_args() -> argparse.Namespace:
@@ -389,12 +475,28 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Path where the PDF should be written (default: dist/report.pdf)",
     )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Compress page streams with FlateDecode (binary output, not ASCII-friendly)",
+    )
+    parser.add_argument(
+        "--glob",
+        metavar="PATTERN",
+        help="Render every HTML file matching PATTERN (e.g. 'dist/*.html') to a sibling .pdf",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    build_pdf(args.html, args.pdf)
+    if args.glob:
+        html_paths = [Path(path) for path in sorted(glob.glob(args.glob))]
+        if not html_paths:
+            raise SystemExit(f"No HTML report matches {args.glob!r}")
+        build_pdfs([(path, path.with_suffix(".pdf")) for path in html_paths], compress=args.compress)
+        return
+    build_pdf(args.html, args.pdf, compress=args.compress)
 
 
 if __name__ == "__main__":
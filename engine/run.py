@@ -3,9 +3,21 @@
 # Add: region_breakdown nel payload + quota Asia=3 (temporanea)
 # Include fix recency + query locali Asia
 
-import os, json, re, requests
-from datetime import datetime, timedelta
+import os, json, re, time, heapq, hashlib, shutil, requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+try:
+    import ahocorasick   # pyahocorasick (opzionale): tutte le keyword in un solo passaggio
+except ImportError:
+    ahocorasick = None
+try:
+    import orjson   # opzionale: encode/decode JSON in C, stesso output di json con ensure_ascii=False
+except ImportError:
+    orjson = None
 
 API_URL = os.getenv("ANYCRAWL_API_URL", "https://api.anycrawl.dev").rstrip("/")
 API_KEY = os.getenv("ANYCRAWL_API_KEY", "")
@@ -36,18 +48,25 @@ TOK_TH = ["ทีมชาติ U20","ทีมชาติ U19","เดบิ
 TOK_VI = ["U20","U19","đội tuyển","ra mắt","ghi bàn","kiến tạo","chuyển nhượng","cho mượn"]
 TOK_ID = ["U20","U19","timnas","debut","gol","assist","pinjaman","transfer"]
 
+SITE_OR_CHUNK=4   # host per query: "(site:a OR site:b ...) tok" al posto di una ricerca per host
+
+def site_groups(hosts,n=SITE_OR_CHUNK):
+    for i in range(0,len(hosts),n):
+        chunk=hosts[i:i+n]
+        yield f"site:{chunk[0]}" if len(chunk)==1 else "("+" OR ".join(f"site:{h}" for h in chunk)+")"
+
 def build_site_queries():
     out=[]
     for hosts in SITE_PACKS.values():
-        for h in hosts:
-            out += [f"site:{h} U20", f"site:{h} U19", f"site:{h} debut U20", f"site:{h} youth U20"]
+        for g in site_groups(hosts):
+            out += [f"{g} U20", f"{g} U19", f"{g} debut U20", f"{g} youth U20"]
     return out
 
 def build_asia_lang_queries():
-    out=[]; asia_hosts=SITE_PACKS["asia"]
-    for h in asia_hosts:
+    out=[]
+    for g in site_groups(SITE_PACKS["asia"]):
         for tok in (TOK_JP+TOK_KR+TOK_AR+TOK_TH+TOK_VI+TOK_ID):
-            out.append(f"site:{h} {tok}")
+            out.append(f"{g} {tok}")
     out += [
         "U-20 日本代表 デビュー","U-20 代表 得点",
         "U-20 대표팀 데뷔 득점","U-20 대표팀 이적 임대",
@@ -56,17 +75,28 @@ def build_asia_lang_queries():
     ]
     return out
 
-QUERIES = BASE_QUERIES + build_site_queries() + build_asia_lang_queries()
+# dict.fromkeys: toglie i doppioni (es. "(site:...) U20" da site pack e token VI/ID) mantenendo l'ordine
+QUERIES = list(dict.fromkeys(BASE_QUERIES + build_site_queries() + build_asia_lang_queries()))
 
 # ---------- heuristics ----------
-MAX_SERP=14; MIN_TEXT_LEN=600; TIMEOUT_S=50; RECENT_DAYS=21; CACHE_TTL_DAYS=14
+MAX_SERP=14; MIN_TEXT_LEN=600; MAX_TEXT_LEN=32768; TIMEOUT_S=50; RECENT_DAYS=21; CACHE_TTL_DAYS=14
+PROBE_TIMEOUT_S=5; PROBE_WORKERS=8
+AC_WORKERS=4   # chiamate AnyCrawl concorrenti (rate limit)
 REGION_MIN_QUOTAS={"africa":2,"asia":3}   # quota temporanea Asia=3
 TOP_K=10
 
-CACHE_PATH="data/cache_seen.json"; OUT_DIR="output"; SNAP_DIR=os.path.join(OUT_DIR,"snapshots")
+FALLBACK_ITEMS=({"entity":"PLAYER","label":"Demo anomaly","anomaly_type":"NOISE_PULSE","score":10,"why":["fallback"],"links":["https://github.com/mtornani/OB1-Radar"]},)
+
+CACHE_PATH="data/cache_seen.json"; CACHE_MAX=100_000
+CACHE_LOG_PATH="data/cache_seen.jsonl"; CACHE_LOG_MAX_BYTES=512*1024; SEEN_PENDING=[]   # URL marcati in questo run, da appendere al log
+OUT_DIR="output"; SNAP_DIR=os.path.join(OUT_DIR,"snapshots")
+SCRAPE_CACHE_DIR=os.path.join(OUT_DIR,".scrape_cache")   # risposte AnyCrawl su disco: /v1/scrape (solo testo >= MIN_TEXT_LEN) valide RECENT_DAYS, /v1/search SEARCH_CACHE_TTL_S
+SEARCH_CACHE_TTL_S=12*3600
+DEBUG=bool(os.getenv("OB1_DEBUG"))   # JSON indentato solo in debug
 BLOCK_EXT=(".pdf",".jpg",".jpeg",".png",".gif",".svg",".webp",".zip",".rar")
 NEG_URL_PATTERNS=("/rules","/reglas","/regulations","/how-to","/como-","/guia","/guide","/privacy","/cookies","/terminos","/terms","/about","/acerca-")
 OFF_PATTERNS=("basket","baloncesto","basquete","handball","handebol","voleibol","volei","rugby","/economia","/politica","/motori","almanacco","forumfree","facebook.com","instagram.com","tiktok.com","wikipedia.org")
+OFF_RE=re.compile("|".join(map(re.escape,OFF_PATTERNS))); NEG_URL_RE=re.compile("|".join(map(re.escape,NEG_URL_PATTERNS)))
 HOST_BLOCKLIST={"apwin.com"}; HOST_PENALTY={"transferfeed.com":0.6,"olympics.com":0.85}
 TRUST_WEIGHTS={
     "cafonline.com":1.20,"cosafa.com":1.15,"cecafaonline.com":1.12,"ufoawafub.com":1.10,
@@ -74,6 +104,11 @@ TRUST_WEIGHTS={
     "jfa.jp":1.18,"kfa.or.kr":1.15,"vff.org.vn":1.10,"fathailand.org":1.10,"qfa.qa":1.10,"the-aiff.com":1.10,"pssi.org":1.08,
     "conmebol.com":1.18,"ge.globo.com":1.18,"ole.com.ar":1.15,"tycsports.com":1.10,"as.com":1.08,"marca.com":1.08,
 }
+HOST_REGION={h:reg for reg in ("africa","asia") for h in SITE_PACKS[reg]}
+AFRICA_TLDS=(".za",".ng",".gh",".ma",".tn",".dz",".ke",".ug",".tz",".sn",".cm")
+ASIA_TLDS=(".jp",".kr",".id",".th",".vn",".my",".in",".cn",".ph",".sg",".qa",".ae",".sa",".kw",".bh",".om",".jo")
+SOUTH_AMERICA_TLDS=(".br",".ar",".cl",".uy",".pe",".co",".py",".bo",".ec",".ve")
+TLD_REGION={tld[1:]:reg for reg,tlds in (("africa",AFRICA_TLDS),("asia",ASIA_TLDS),("south-america",SOUTH_AMERICA_TLDS)) for tld in tlds}
 DOMAIN_ENGINE={"kfa.or.kr":"playwright","qfa.qa":"playwright","the-aiff.com":"playwright"}
 
 POS_WEIGHTS={
@@ -85,49 +120,158 @@ POS_WEIGHTS={
     r"\bconvocado\b|\bconvocato\b|\bselecci[oó]n(?:ado)?\b|\bs[eé]lectionn[ée]?\b|\bcalled up\b":1.4,
     r"\bnazionale\b|\bsele[cç][aã]o\b|\bselecci[oó]n\b|\bnational team\b|\bs[eé]lection\b":1.2,
 }
+# compilati una volta (testo già lowercase), pesi decrescenti per saturare prima
+POS_PATTERNS=sorted(((re.compile(p),w) for p,w in POS_WEIGHTS.items()),key=lambda x:-x[1])
 MUST_HAVE_REGEX=re.compile(r"(f[uú]tbol|futebol|football|soccer|primavera|cantera|juvenil|u[\-\s]?20|u[\-\s]?19|u[\-\s]?17|日本代表|代表|デビュー|得点|アシスト|대표팀|데뷔|득점|منتخب|تحت\s?20|ظهور|ทีมชาติ|เดบิวต์|đội tuyển|ra mắt|timnas)")
 NEG_PATTERNS=("cookie","privacy","accetta","banner","abbonati","paywall","newsletter")
+NEG_RE=re.compile("|".join(map(re.escape,NEG_PATTERNS)))
+SIGNAL_KEYWORDS=("gol","goal","goles","gols","buts","assist","asistencia","assistência","passe decisiva",
+    "primavera","juvenil","u20","u-20","u19","u-19","u17","u-17","under","transfer","mercato","fichaje",
+    "traspaso","préstamo","empréstimo","loan","prêt","debut","debutto","esordio","estreia",
+    "sélection","selección","nazionale","national team","conmebol","caf","afc","concacaf",
+    "デビュー","得点","アシスト","移籍","レンタル","데뷔","득점","도움","이적","임대",
+    "منتخب","تحت 20","سجل","صنع","انتقال","إعارة","ظهور","เดบิวต์","ยิง","แอสซิสต์","ยืมตัว","โอนย้าย",
+    "ra mắt","ghi bàn","kiến tạo","chuyển nhượng","cho mượn","timnas","pinjaman")
+
+def build_automaton(buckets):
+    # buckets: {nome: keyword}; ogni match restituisce (nome, keyword)
+    if ahocorasick is None: return None
+    A=ahocorasick.Automaton()
+    for b,words in buckets.items():
+        for w in words: A.add_word(w,(b,w))
+    A.make_automaton(); return A
+GOOD_AC=build_automaton({"sig":SIGNAL_KEYWORDS,"neg":NEG_PATTERNS})
+URL_BLOCK_AC=build_automaton({"url":OFF_PATTERNS+NEG_URL_PATTERNS})   # basta il primo match
 TOURNAMENT_CONFED={"maurice revello":"international","toulon":"international","conmebol":"CONMEBOL","sudamericano":"CONMEBOL","caf u-20":"CAF","u-20 afcon":"CAF","afc u20":"AFC","u20 asian cup":"AFC","concacaf u-20":"CONCACAF"}
 
 # ---------- AnyCrawl ----------
+SESSION=requests.Session()   # keep-alive condiviso (API + probe HEAD)
+POOL=HTTPAdapter(pool_connections=16,pool_maxsize=16)   # stesso pool anche per host in chiaro (probe HEAD)
+SESSION.mount("https://",POOL); SESSION.mount("http://",POOL)
+# solo verso AnyCrawl: retry con backoff sui 502/503/504 (il prefisso più lungo vince sul mount generico);
+# niente retry su read/altri errori: un POST scaduto per timeout verrebbe ripetuto (e fatturato) fino a 3×TIMEOUT_S
+SESSION.mount(API_URL,HTTPAdapter(pool_connections=1,pool_maxsize=16,max_retries=Retry(
+    total=2,read=0,other=0,backoff_factor=0.5,status_forcelist=(502,503,504),
+    allowed_methods=frozenset({"POST"}),raise_on_status=False)))
+
 def ac_post(path,payload):
     try:
-        r=requests.post(f"{API_URL}{path}",headers=HEADERS,json=payload,timeout=TIMEOUT_S)
+        r=SESSION.post(f"{API_URL}{path}",headers=HEADERS,json=payload,timeout=TIMEOUT_S)
         if r.status_code>=400:
             print(f"[AnyCrawl] {path} HTTP {r.status_code} :: {r.text[:200]}"); return None
         return r.json()
     except Exception as e:
         print(f"[AnyCrawl] error {path}: {e}"); return None
 
-def ac_search(query,pages=1,limit=20,lang="all"): return ac_post("/v1/search",{"query":query,"pages":pages,"limit":limit,"lang":lang})
-def ac_scrape(url,engine="cheerio"): return ac_post("/v1/scrape",{"url":url,"engine":engine,"formats":["markdown","text"]})
+def ac_search(query,pages=1,limit=20,lang="all"):
+    # SERP in cache solo SEARCH_CACHE_TTL_S: un rilancio nella stessa giornata non ripete le ricerche, il run del giorno dopo sì
+    key=f"search {lang} {pages} {limit} {query}"
+    js=scrape_cache_get(key,SEARCH_CACHE_TTL_S)
+    if js is None:
+        js=ac_post("/v1/search",{"query":query,"pages":pages,"limit":limit,"lang":lang})
+        if js: scrape_cache_put(key,js)
+    return js
+
+@lru_cache(maxsize=256)
+def ac_scrape(url,engine="cheerio"):
+    key=f"{engine} {url}"
+    js=scrape_cache_get(key,RECENT_DAYS*86400)
+    if js is None:
+        js=ac_post("/v1/scrape",{"url":url,"engine":engine,"formats":["markdown","text"]})
+        # su disco solo le pagine utili: una risposta sottile (consent wall, render vuoto) va riprovata al run successivo
+        if len(text_from_page(js))>=MIN_TEXT_LEN: scrape_cache_put(key,js)
+    return js
+
+def scrape_cache_path(key): return os.path.join(SCRAPE_CACHE_DIR,hashlib.sha1(key.encode("utf-8")).hexdigest()+".json")
+def scrape_cache_get(key,ttl):
+    try:
+        with open(scrape_cache_path(key),"rb") as f: rec=load_json(f.read())
+    except: return None
+    if time.time()-rec.get("ts",0)>ttl: return None
+    return rec.get("data")
+def scrape_cache_put(key,js):
+    try:
+        os.makedirs(SCRAPE_CACHE_DIR,exist_ok=True)
+        with open(scrape_cache_path(key),"wb") as f: f.write(dump_json({"ts":int(time.time()),"key":key,"data":js}))
+    except OSError as e: print(f"[cache] risposta non salvata {key}: {e}")
+def prune_scrape_cache():
+    cutoff=time.time()-RECENT_DAYS*86400
+    try: names=os.listdir(SCRAPE_CACHE_DIR)
+    except OSError: return
+    for n in names:
+        p=os.path.join(SCRAPE_CACHE_DIR,n)
+        try:
+            if os.path.getmtime(p)<cutoff: os.remove(p)
+        except OSError: pass
+
+def dump_json(obj,indent=DEBUG):
+    # -> bytes UTF-8; senza indent json usa l'encoder C (one-shot), indent=2 forza quello Python
+    if orjson is not None: return orjson.dumps(obj,option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent: return json.dumps(obj,ensure_ascii=False,indent=2).encode("utf-8")
+    return json.dumps(obj,ensure_ascii=False,separators=(",",":")).encode("utf-8")
+load_json=orjson.loads if orjson is not None else json.loads   # entrambi accettano bytes
 
 # ---------- cache ----------
 def load_cache():
+    raw={}
     try:
-        with open(CACHE_PATH,"r",encoding="utf-8") as f: return json.load(f)
-    except: return {}
-def save_cache(cache): os.makedirs(os.path.dirname(CACHE_PATH),exist_ok=True); open(CACHE_PATH,"w",encoding="utf-8").write(json.dumps(cache,ensure_ascii=False,indent=2))
+        with open(CACHE_PATH,"rb") as f: raw=load_json(f.read())
+    except: pass
+    # overlay dei run successivi all'ultima compattazione (una riga JSON per URL marcato)
+    try:
+        with open(CACHE_LOG_PATH,"rb") as f:
+            for line in f:
+                try: rec=load_json(line)
+                except ValueError: continue   # riga troncata da un run interrotto
+                if isinstance(rec,dict) and rec.get("url"): raw[rec.pop("url")]=rec
+    except OSError: pass
+    # via i record scaduti (is_seen converte anche i vecchi ISO), poi tetto ai CACHE_MAX più recenti
+    cache={u:rec for u,rec in raw.items() if isinstance(rec,dict) and is_seen(raw,u)}
+    if len(cache)>CACHE_MAX:
+        cache=dict(heapq.nlargest(CACHE_MAX,cache.items(),key=lambda kv: kv[1]["seen_at"]))
+    return cache
+def save_cache(cache):
+    # di norma solo append dei record nuovi; riscrittura completa (atomica) quando il log supera CACHE_LOG_MAX_BYTES
+    os.makedirs(os.path.dirname(CACHE_PATH),exist_ok=True)
+    try: compact=not os.path.exists(CACHE_PATH) or os.path.getsize(CACHE_LOG_PATH)>CACHE_LOG_MAX_BYTES
+    except OSError: compact=False
+    if compact:
+        tmp=CACHE_PATH+".tmp"   # scrittura atomica: un run interrotto non lascia un JSON troncato
+        with open(tmp,"wb") as f: f.write(dump_json(cache))
+        os.replace(tmp,CACHE_PATH)
+        open(CACHE_LOG_PATH,"wb").close()
+    else:
+        with open(CACHE_LOG_PATH,"ab") as f:
+            f.write(b"".join(dump_json({"url":u,**cache[u]},indent=False)+b"\n" for u in SEEN_PENDING if u in cache))
+    SEEN_PENDING.clear()
 def is_seen(cache,url):
-    rec=cache.get(url); 
+    rec=cache.get(url)
     if not rec: return False
-    try: seen=datetime.fromisoformat(rec["seen_at"])
-    except: return False
-    return (datetime.utcnow()-seen)<timedelta(days=CACHE_TTL_DAYS)
-def mark_seen(cache,url,host): cache[url]={"host":host,"seen_at":datetime.utcnow().isoformat(timespec="seconds")}
+    ts=rec.get("seen_at")
+    if isinstance(ts,str):   # record vecchi in ISO (utc naive): convertiti una volta, poi salvati come epoch
+        try: ts=rec["seen_at"]=int(datetime.fromisoformat(ts).replace(tzinfo=timezone.utc).timestamp())
+        except ValueError: return False
+    return isinstance(ts,(int,float)) and time.time()-ts<CACHE_TTL_DAYS*86400
+def mark_seen(cache,url,host,accepted=True,ts=None):
+    cache[url]={"host":host,"seen_at":ts or int(time.time()),"accepted":accepted}; SEEN_PENDING.append(url)
 
 # ---------- utils ----------
+# stesse URL ritornano su molte QUERIES: parse una volta sola
+@lru_cache(maxsize=4096)
 def normalize_url(u):
-    p=urlparse(u)
-    if not p.scheme: return u
+    # -> (url normalizzato, host): un solo urlparse per candidato
+    p=urlparse(u); host=p.netloc.lower()
+    if not p.scheme: return u,host
+    if not p.query: return urlunparse((p.scheme,host,p.path,"","","")),host   # caso comune: niente parse_qsl/urlencode
     q=[(k,v) for k,v in parse_qsl(p.query,keep_blank_values=True) if not k.lower().startswith("utm_")]
-    return urlunparse((p.scheme,p.netloc.lower(),p.path,"",urlencode(sorted(q)),""))
-def allowed_url(u):
+    return urlunparse((p.scheme,host,p.path,"",urlencode(sorted(q)),"")),host
+@lru_cache(maxsize=4096)
+def allowed_url(u,host):
     lu=u.lower()
-    if any(lu.endswith(ext) for ext in BLOCK_EXT): return False
-    if any(tok in lu for tok in OFF_PATTERNS): return False
-    if any(tok in lu for tok in NEG_URL_PATTERNS): return False
-    host=urlparse(u).netloc.lower()
+    if lu.endswith(BLOCK_EXT): return False
+    if URL_BLOCK_AC is not None:
+        if next(URL_BLOCK_AC.iter(lu),None) is not None: return False
+    elif OFF_RE.search(lu) or NEG_URL_RE.search(lu): return False
     if host in HOST_BLOCKLIST: return False
     return True
 def text_from_page(scrape_json):
@@ -136,31 +280,67 @@ def text_from_page(scrape_json):
     t=data.get("markdown") or data.get("text") or ""
     return t if isinstance(t,str) else ""
 
-def good_text(txt):
-    t=(txt or "").lower()
+# le funzioni di analisi ricevono il testo già lowercase (una sola copia per pagina, vedi main)
+def good_text(t):
     if len(t)<MIN_TEXT_LEN: return False
     if not MUST_HAVE_REGEX.search(t): return False
-    if sum(t.count(w) for w in NEG_PATTERNS)>20: return False
+    if GOOD_AC is not None:
+        # un solo passaggio per rumore (cookie/paywall...) e keyword di segnale
+        sig=neg=0
+        for _,(b,_) in GOOD_AC.iter(t):
+            if b=="neg":
+                neg+=1
+                if neg>20: return False
+            else: sig+=1
+        return sig>=2
+    # prima il controllo economico (str.count con uscita anticipata), poi il rumore fermandosi al 21° match
+    if signal_hits(t,limit=2)<2: return False
+    neg=0
+    for _ in NEG_RE.finditer(t):
+        neg+=1
+        if neg>20: return False
+    return True
+
+def signal_hits(t,limit=None):
+    # conta le keyword di segnale; con limit si ferma appena la soglia è raggiunta
     hits=0
-    for k in ["gol","goal","goles","gols","buts","assist","asistencia","assistência","passe decisiva",
-              "primavera","juvenil","u20","u-20","u19","u-19","u17","u-17","under","transfer","mercato","fichaje",
-              "traspaso","préstamo","empréstimo","loan","prêt","debut","debutto","esordio","estreia",
-              "sélection","selección","nazionale","national team","conmebol","caf","afc","concacaf",
-              "デビュー","得点","アシスト","移籍","レンタル","데뷔","득점","도움","이적","임대",
-              "منتخب","تحت 20","سجل","صنع","انتقال","إعارة","ظهور","เดบิวต์","ยิง","แอสซิสต์","ยืมตัว","โอนย้าย",
-              "ra mắt","ghi bàn","kiến tạo","chuyển nhượng","cho mượn","timnas","pinjaman"]:
+    for k in SIGNAL_KEYWORDS:
         hits+=t.count(k)
-    return hits>=2
-
-def score_text(txt):
-    t=(txt or "").lower(); score=0.0
-    for pat,w in POS_WEIGHTS.items(): score+=w*len(re.findall(pat,t))
+        if limit and hits>=limit: break
+    return hits
+
+def score_text(t):
+    score=0.0
+    for rx,w in POS_PATTERNS:
+        n=0
+        for _ in rx.finditer(t):   # niente lista di match; stop appena si raggiunge il tetto
+            n+=1
+            if score+w*n>=100: return 100.0   # pesi tutti positivi: il clamp darebbe comunque 100
+        score+=w*n
     return float(max(0,min(100,round(score,2))))
 
-def infer_type(txt):
-    t=(txt or "").lower()
-    if re.search(r"\besordio\b|\bdebut(?:é|e|o|ou)?\b|デビュー|데뷔|ظهور|เดบิวต์|ra mắt",t): return "PLAYER_BURST"
-    if re.search(r"\btransfer\b|\bmercato\b|\bfichaje\b|\btraspaso\b|\bpr[êe]t\b|\bpréstamo\b|\bempr[eê]stimo\b|\bloan\b|\bcedid[oa]\b|\bcedut[oa]\b|\bsigned\b|移籍|レンタル|이적|임대|انتقال|إعارة|chuyển nhượng|cho mượn|pinjaman",t): return "TRANSFER_SIGNAL"
+DEBUT_RE=re.compile(r"\besordio\b|\bdebut(?:é|e|o|ou)?\b|デビュー|데뷔|ظهور|เดบิวต์|ra mắt")
+TRANSFER_RE=re.compile(r"\btransfer\b|\bmercato\b|\bfichaje\b|\btraspaso\b|\bpr[êe]t\b|\bpréstamo\b|\bempr[eê]stimo\b|\bloan\b|\bcedid[oa]\b|\bcedut[oa]\b|\bsigned\b|移籍|レンタル|이적|임대|انتقال|إعارة|chuyển nhượng|cho mượn|pinjaman")
+
+WHY_KEYWORDS={
+    "youth":["primavera","juvenil","ユース","유스","đội trẻ","เยาวชน"],
+    "mercato":["transfer","mercato","fichaje","traspaso","préstamo","empréstimo","loan","prêt","signed","移籍","レンタル","이적","임대","chuyển nhượng","cho mượn","pinjaman"],
+    "prestazioni":["gol","goal","goles","gols","buts","assist","asistencia","assistência","passe decisiva","得点","アシスト","득점","도움","ghi bàn","kiến tạo","ยิง","แอสซิสต์"],
+}
+# un solo passaggio per tutti i tag; il lookahead rende i match a larghezza zero,
+# così una keyword che si sovrappone a quella di un altro gruppo non viene persa
+WHY_RE=re.compile("(?="+"|".join(f"(?P<{g}>"+"|".join(map(re.escape,ks))+")" for g,ks in WHY_KEYWORDS.items())+f"|(?P<esordio>{DEBUT_RE.pattern}))")
+
+def why_tags(t):
+    tags=set()
+    for m in WHY_RE.finditer(t):
+        tags.add(m.lastgroup)
+        if len(tags)==4: break
+    return tags
+
+def infer_type(t):
+    if DEBUT_RE.search(t): return "PLAYER_BURST"
+    if TRANSFER_RE.search(t): return "TRANSFER_SIGNAL"
     return "NOISE_PULSE"
 
 # date inference (robusta)
@@ -169,40 +349,45 @@ ES_MONTHS=["enero","febrero","marzo","abril","mayo","junio","julio","agosto","se
 PT_MONTHS=["janeiro","fevereiro","março","abril","maio","junho","julho","agosto","setembro","outubro","novembro","dezembro"]
 FR_MONTHS=["janvier","février","fevrier","mars","avril","mai","juin","juillet","août","aout","septembre","octobre","novembre","décembre","decembre"]
 MONTHS_ALL=IT_MONTHS+ES_MONTHS+PT_MONTHS+FR_MONTHS
-
-def guess_date_from_text_or_url(txt,url):
-    t=(txt or "").lower()
-    m=re.search(r"/(20\d{2})[\/\-](0[1-9]|1[0-2])[\/\-](0[1-9]|[12]\d|3[01])",url)
+URL_YMD_RE=re.compile(r"/(20\d{2})[\/\-](0[1-9]|1[0-2])[\/\-](0[1-9]|[12]\d|3[01])")
+URL_YM_RE=re.compile(r"(20\d{2})[\/\-](0[1-9]|1[0-2])")
+TEXT_ISO_DATE_RE=re.compile(r"(20\d{2})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])")
+TEXT_DMY_RE=re.compile(r"\b(0?[1-9]|[12]\d|3[01])[\/\-](0?[1-9]|1[0-2])[\/\-](20\d{2})\b")
+MONTH_TO_IDX={}
+for lst in (IT_MONTHS,ES_MONTHS,PT_MONTHS,FR_MONTHS):
+    for i,name in enumerate(lst): MONTH_TO_IDX.setdefault(name,i+1)
+# "12 marzo 2025": parola generica + lookup nel dict invece di un'alternanza di 54 mesi
+TEXT_MONTH_DATE_RE=re.compile(r"\b(0?[1-9]|[12]\d|3[01])\s+([^\W\d_]+)\s+(20\d{2})\b")
+YEAR_RE=re.compile(r"\b(20\d{2})\b")
+
+def guess_date_from_text_or_url(t,url):
+    m=URL_YMD_RE.search(url)
     if m:
         y,mm,dd=map(int,m.groups())
         try: return datetime(y,mm,dd)
         except: pass
-    m=re.search(r"(20\d{2})[\/\-](0[1-9]|1[0-2])",url)
+    m=URL_YM_RE.search(url)
     if m:
         y,mm=map(int,m.groups())
         try: return datetime(y,mm,1)
         except: pass
-    m=re.search(r"(20\d{2})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])",t)
+    m=TEXT_ISO_DATE_RE.search(t)
     if m:
         y,mm,dd=map(int,m.groups())
         try: return datetime(y,mm,dd)
         except: pass
-    m=re.search(r"\b(0?[1-9]|[12]\d|3[01])[\/\-](0?[1-9]|1[0-2])[\/\-](20\d{2})\b",t)
+    m=TEXT_DMY_RE.search(t)
     if m:
         dd,mm,y=map(int,m.groups())
         try: return datetime(y,mm,dd)
         except: pass
-    months="|".join([re.escape(x) for x in MONTHS_ALL])
-    m=re.search(r"\b(0?[1-9]|[12]\d|3[01])\s+("+months+r")\s+(20\d{2})\b",t)
-    if m:
-        dd=int(m.group(1)); name=m.group(2); y=int(m.group(3))
-        def idx(name):
-            for lst in (IT_MONTHS,ES_MONTHS,PT_MONTHS,FR_MONTHS):
-                if name in lst: return lst.index(name)+1
-            return 1
-        try: return datetime(y,idx(name),dd)
+    for m in TEXT_MONTH_DATE_RE.finditer(t):
+        mm=MONTH_TO_IDX.get(m.group(2))
+        if mm is None: continue
+        try: return datetime(int(m.group(3)),mm,int(m.group(1)))
         except: pass
-    m=re.search(r"\b(20\d{2})\b",t)
+        break
+    m=YEAR_RE.search(t)
     if m:
         y=int(m.group(1))
         try: return datetime(y,1,1)
@@ -216,75 +401,124 @@ def recency_boost(dt,now=None):
     if age<=RECENT_DAYS: return round(10.0*(1-age/RECENT_DAYS),2)
     return 0.0
 
-def domain_weight(url):
-    host=urlparse(url).netloc.lower()
+def suffix_lookup(host,table):
+    # host e suffissi per etichetta ("m.ole.com.ar" -> "ole.com.ar" -> "com.ar" -> "ar"): il più specifico vince.
+    # Al posto di "k in host", che faceva pesare anche "vegas.com" come "as.com"
+    while True:
+        v=table.get(host)
+        if v is not None: return v
+        i=host.find(".")
+        if i<0: return None
+        host=host[i+1:]
+
+def domain_weight(host):
     if host in HOST_PENALTY: return HOST_PENALTY[host]
-    for k,w in TRUST_WEIGHTS.items():
-        if k in host: return w
-    return 1.0
+    w=suffix_lookup(host,TRUST_WEIGHTS)
+    return 1.0 if w is None else w
 
 def region_from_host_or_tld(host):
     h=host.lower()
-    if any(dom in h for dom in SITE_PACKS["africa"]): return "africa"
-    if any(dom in h for dom in SITE_PACKS["asia"]): return "asia"
-    if h.endswith((".za",".ng",".gh",".ma",".tn",".dz",".ke",".ug",".tz",".sn",".cm")): return "africa"
-    if h.endswith((".jp",".kr",".id",".th",".vn",".my",".in",".cn",".ph",".sg",".qa",".ae",".sa",".kw",".bh",".om",".jo")): return "asia"
-    if h.endswith((".br",".ar",".cl",".uy",".pe",".co",".py",".bo",".ec",".ve")): return "south-america"
-    return "unknown"
+    reg=suffix_lookup(h,HOST_REGION)
+    if reg is not None: return reg
+    _,dot,tld=h.rpartition(".")
+    return TLD_REGION.get(tld,"unknown") if dot else "unknown"
 
-def infer_confed(txt):
-    t=(txt or "").lower()
+def infer_confed(t):
     for k,conf in TOURNAMENT_CONFED.items():
         if k in t: return conf
     return "unknown"
 
+# tag why + confederazione nello stesso passaggio AC; esordio resta su DEBUT_RE (confini di parola)
+TAGS_AC=build_automaton({**WHY_KEYWORDS,"confed":TOURNAMENT_CONFED})
+CONFED_PRIO={k:i for i,k in enumerate(TOURNAMENT_CONFED)}
+
+def text_tags(t):
+    if TAGS_AC is None: return why_tags(t),infer_confed(t)
+    why=set(); best=None
+    for _,(b,k) in TAGS_AC.iter(t):
+        if b!="confed": why.add(b)
+        elif best is None or CONFED_PRIO[k]<CONFED_PRIO[best]: best=k   # vince l'ordine del dict, non quello del testo
+        if len(why)==len(WHY_KEYWORDS) and best is not None and CONFED_PRIO[best]==0: break
+    if DEBUT_RE.search(t): why.add("esordio")
+    return why,("unknown" if best is None else TOURNAMENT_CONFED[best])
+
+def analyze(t,url):
+    # tutto ciò che dipende solo dal testo (già lowercase) e dall'URL: -> (score, tipo, data, confed, why)
+    why,conf=text_tags(t)
+    return score_text(t),infer_type(t),guess_date_from_text_or_url(t,url),conf,why
+
+JS_HEAVY_HOSTS=set()   # host dove cheerio è risultato sottile e playwright no (appresi durante il run)
+
 def preferred_engine_for(host):
-    for dom,eng in DOMAIN_ENGINE.items():
-        if dom in host.lower(): return eng
-    return "cheerio"
+    if host in JS_HEAVY_HOSTS: return "playwright"
+    return suffix_lookup(host,DOMAIN_ENGINE) or "cheerio"
 
-def ac_scrape_smart(url):
-    host=urlparse(url).netloc
+def ac_scrape_smart(url,host):
     eng=preferred_engine_for(host)
     js=ac_scrape(url,engine=eng) or {}
     if len(text_from_page(js))<MIN_TEXT_LEN and eng!="playwright":
         js2=ac_scrape(url,engine="playwright")
+        if len(text_from_page(js2))>=MIN_TEXT_LEN: JS_HEAVY_HOSTS.add(host)   # prossimi URL dello stesso host: subito playwright
         return (js2 or js),"playwright" if js2 else eng
     return js,eng
 
+def head_ok(url):
+    # prefiltro economico prima di /v1/scrape: scarta solo i casi certi (404/410, contenuto non HTML)
+    try: r=SESSION.head(url,timeout=PROBE_TIMEOUT_S,allow_redirects=True)
+    except Exception: return True   # HEAD bloccato/timeout: nel dubbio decide AnyCrawl
+    if r.status_code in (404,410): return False
+    ct=r.headers.get("content-type","").lower()
+    return not ct or "html" in ct
+
+def prefilter_candidates(cands):
+    if not cands: return cands
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as ex: oks=list(ex.map(lambda c: head_ok(c["url"]),cands))
+    return [c for c,ok in zip(cands,oks) if ok]
+
 # ---------- pipeline ----------
+def serp_rows(q):
+    sr=ac_search(q,pages=1,limit=MAX_SERP,lang="all") or {}
+    return sr.get("data") or sr.get("results") or []
+
+def serp_relevant(title,snippet):
+    # good_text pretende MUST_HAVE nel testo: se titolo+snippet non lo contengono lo scrape è quasi sempre sprecato.
+    # Solo con snippet presente: il titolo da solo è troppo corto per scartare ("Sub-20: ..." senza "futebol")
+    if not snippet: return True
+    return MUST_HAVE_REGEX.search(f"{title} {snippet}".lower()) is not None
+
 def collect_candidates(cache):
     seen,per_host,cand=set(),{},[]
-    for q in QUERIES:
-        sr=ac_search(q,pages=1,limit=MAX_SERP,lang="all") or {}
-        rows=sr.get("data") or sr.get("results") or []
-        for r in rows:
-            url=r.get("url"); title=(r.get("title") or "").strip()
-            if not url or not title: continue
-            if not allowed_url(url):  continue
-            nu=normalize_url(url); host=urlparse(nu).netloc.lower()
-            if nu in seen or is_seen(cache,nu): continue
-            cap=1 if (host in HOST_PENALTY or host in HOST_BLOCKLIST) else 2
-            if per_host.get(host,0)>=cap: continue
-            seen.add(nu); per_host[host]=per_host.get(host,0)+1
-            cand.append({"title":title,"url":nu})
-        if len(cand)>=MAX_SERP: break
+    with ThreadPoolExecutor(max_workers=AC_WORKERS) as ex:
+        # ondate di AC_WORKERS query in parallelo, risultati processati in ordine:
+        # stessa selezione del loop seriale, al massimo AC_WORKERS-1 ricerche in più
+        for i in range(0,len(QUERIES),AC_WORKERS):
+            for rows in ex.map(serp_rows,QUERIES[i:i+AC_WORKERS]):
+                for r in rows:
+                    url=r.get("url"); title=(r.get("title") or "").strip()
+                    if not url or not title: continue
+                    if not serp_relevant(title,r.get("description") or r.get("snippet")): continue
+                    nu,host=normalize_url(url)   # host dallo stesso urlparse, riusato da allowed_url
+                    if not allowed_url(url,host):  continue
+                    if nu in seen or is_seen(cache,nu): continue
+                    cap=1 if (host in HOST_PENALTY or host in HOST_BLOCKLIST) else 2
+                    if per_host.get(host,0)>=cap: continue
+                    seen.add(nu); per_host[host]=per_host.get(host,0)+1
+                    cand.append({"title":title,"url":nu,"host":host})
+                    if len(cand)>=MAX_SERP: break
+                if len(cand)>=MAX_SERP: break
+            if len(cand)>=MAX_SERP: break
     return cand[:MAX_SERP]
 
 def select_with_region_quotas(items,k=TOP_K,quotas=REGION_MIN_QUOTAS):
     picked,used=[],set()
     for region,q in quotas.items():
-        pool=[it for it in items if region in it.get("why",[])]
-        pool.sort(key=lambda x:x.get("score",0),reverse=True)
-        for it in pool[:q]:
+        pool=heapq.nlargest(q,(it for it in items if region in it.get("why",[])),key=lambda x:x.get("score",0))
+        for it in pool:
             key=tuple(it.get("links",[]))
             if key in used: continue
             picked.append(it); used.add(key)
-    rest=[it for it in items if tuple(it.get("links",[])) not in used]
-    rest.sort(key=lambda x:x.get("score",0),reverse=True)
-    for it in rest:
-        if len(picked)>=k: break
-        picked.append(it)
+    rest=(it for it in items if tuple(it.get("links",[])) not in used)
+    picked+=heapq.nlargest(max(0,k-len(picked)),rest,key=lambda x:x.get("score",0))
     return picked[:k]
 
 def region_breakdown(items):
@@ -300,58 +534,58 @@ def region_breakdown(items):
     return b
 
 def main():
-    cache=load_cache()
+    cache=load_cache(); prune_scrape_cache()
     cands=collect_candidates(cache)
     print(f"[SERP] candidati: {len(cands)}")
+    cands=prefilter_candidates(cands)
+    print(f"[HEAD] candidati validi: {len(cands)}")
+
+    # fase A: scrape in parallelo (I/O); fase B: filtri e scoring in ordine sul main thread
+    with ThreadPoolExecutor(max_workers=AC_WORKERS) as ex: pages=list(ex.map(lambda c: ac_scrape_smart(c["url"],c["host"]),cands))
 
+    now=datetime.utcnow(); now_ts=int(now.replace(tzinfo=timezone.utc).timestamp())   # un solo "adesso" per tutta la fase B
     items=[]
-    for c in cands:
-        page,used_engine=ac_scrape_smart(c["url"])
+    for c,(page,used_engine) in zip(cands,pages):
         txt=text_from_page(page)
-        if not good_text(txt): continue
+        if len(txt)<MIN_TEXT_LEN: continue   # scrape fallito/sottile: niente copia lowercase
+        t=txt[:MAX_TEXT_LEN].lower()   # oltre i 32k è quasi sempre menu/footer/commenti: tetto al costo di ogni scansione
+        if not good_text(t):
+            mark_seen(cache,c["url"],c["host"],accepted=False,ts=now_ts); continue   # testo pieno ma scartato: non riproporlo per CACHE_TTL_DAYS
 
-        sc=score_text(txt)
-        a_type=infer_type(txt)
-        dt=guess_date_from_text_or_url(txt,c["url"])
-        sc+=recency_boost(dt)
-        sc=float(max(0,min(100,round(sc*domain_weight(c["url"]),2))))
+        sc,a_type,dt,conf,why=analyze(t,c["url"])
+        sc+=recency_boost(dt,now)
+        host=c["host"]
+        sc=float(max(0,min(100,round(sc*domain_weight(host),2))))
 
-        host=urlparse(c["url"]).netloc.lower()
         region=region_from_host_or_tld(host)
-        conf=infer_confed(txt)
         if conf=="international": region="international"
 
-        why=[]
-        if any(k in txt for k in ["primavera","juvenil","ユース","유스","đội trẻ","เยาวชน"]): why.append("youth")
-        if any(k in txt for k in ["transfer","mercato","fichaje","traspaso","préstamo","empréstimo","loan","prêt","signed","移籍","レンタル","이적","임대","chuyển nhượng","cho mượn","pinjaman"]): why.append("mercato")
-        if any(k in txt for k in ["gol","goal","goles","gols","buts","assist","asistencia","assistência","passe decisiva","得点","アシスト","득점","도움","ghi bàn","kiến tạo","ยิง","แอสซิสต์"]): why.append("prestazioni")
-        if re.search(r"\besordio\b|\bdebut(?:é|e|o|ou)?\b|デビュー|데뷔|ظهور|เดบิวต์|ra mắt",txt): why.append("esordio")
-        if dt and (datetime.utcnow()-dt).days<=RECENT_DAYS: why.append("recente")
-        if used_engine=="playwright": why.append("js-heavy")
-        if conf!="unknown": why.append(conf)
-        if region!="unknown": why.append(region)
+        if dt and (now-dt).days<=RECENT_DAYS: why.add("recente")
+        if used_engine=="playwright": why.add("js-heavy")
+        if conf!="unknown": why.add(conf)
+        if region!="unknown": why.add(region)
 
         items.append({
             "entity":"PLAYER","label":c["title"][:80],"anomaly_type":a_type,"score":sc,
-            "why":sorted(set(why)) or ["segnali"],"links":[c["url"]]
+            "why":sorted(why) or ["segnali"],"links":[c["url"]]
         })
 
-        mark_seen(cache,c["url"],host)
+        mark_seen(cache,c["url"],host,ts=now_ts)
 
-    items.sort(key=lambda x:x["score"],reverse=True)
     items=select_with_region_quotas(items,k=TOP_K,quotas=REGION_MIN_QUOTAS)
 
     payload={
-        "generated_at_utc": datetime.utcnow().isoformat(timespec="seconds")+"Z",
+        "generated_at_utc": now.isoformat(timespec="seconds")+"Z",
         "source":"OB1-AnomalyRadar","mode":"anycrawl" if items else "fallback",
         "region_breakdown": region_breakdown(items),
-        "items": items or [{"entity":"PLAYER","label":"Demo anomaly","anomaly_type":"NOISE_PULSE","score":10,"why":["fallback"],"links":["https://github.com/mtornani/OB1-Radar"]}]
+        "items": items or list(FALLBACK_ITEMS)
     }
 
     os.makedirs(OUT_DIR,exist_ok=True); os.makedirs(SNAP_DIR,exist_ok=True)
-    open(os.path.join(OUT_DIR,"daily.json"),"w",encoding="utf-8").write(json.dumps(payload,ensure_ascii=False,indent=2))
-    today=datetime.utcnow().strftime("%Y-%m-%d")
-    open(os.path.join(SNAP_DIR,f"daily-{today}.json"),"w",encoding="utf-8").write(json.dumps(payload,ensure_ascii=False,indent=2))
+    daily=os.path.join(OUT_DIR,"daily.json")
+    with open(daily,"wb") as f: f.write(dump_json(payload))
+    today=now.strftime("%Y-%m-%d")
+    shutil.copyfile(daily,os.path.join(SNAP_DIR,f"daily-{today}.json"))   # snapshot = copia byte per byte, niente seconda serializzazione
     save_cache(cache)
     print(f"[OK] wrote output/daily.json (items={len(items)}) – quotas={REGION_MIN_QUOTAS} breakdown={payload['region_breakdown']}")
 if __name__=="__main__":
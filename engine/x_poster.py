@@ -5,26 +5,38 @@ can't claim we never tried."""
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional
 
 try:
-    import requests  # type: ignore
-except Exception:  # pragma: no cover
-    requests = None
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
+# requests is imported on the first real post: queue-only runs (no token) never load it.
+_HAS_REQUESTS = importlib.util.find_spec("requests") is not None
+
 
 def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).strftime(ISO_FORMAT)
 
 
-@dataclass
+def _jsonl_line(record: Dict[str, Any]) -> bytes:
+    """Encode one queue record as a UTF-8 JSONL line (orjson when installed)."""
+
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@dataclass(slots=True)
 class PostResult:
     status: str
     detail: str
@@ -32,9 +44,15 @@ class PostResult:
 
 
 class XPoster:
-    """Posts predictions to X/Twitter or queues them if credentials are missing."""
+    """Posts predictions to X/Twitter or queues them if credentials are missing.
+
+    The queue file is opened lazily on the first queued record and kept open,
+    unbuffered so every record reaches the file as soon as it is queued; use the
+    poster as a context manager (or call :meth:`close`) to release the handle.
+    """
 
     API_URL = "https://api.x.com/2/tweets"
+    TIMEOUT_S = 30
 
     def __init__(
         self,
@@ -44,6 +62,56 @@ class XPoster:
         self.bearer_token = bearer_token or os.getenv("X_BEARER_TOKEN") or os.getenv("TWITTER_BEARER_TOKEN")
         self.queue_path = Path(queue_path)
         self.queue_path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue_fh: Optional[BinaryIO] = None
+        self._session: Any = None
+
+    def __enter__(self) -> "XPoster":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:  # pragma: no cover - safety net when close() is skipped
+        self.close()
+
+    def close(self) -> None:
+        fh, self._queue_fh = getattr(self, "_queue_fh", None), None
+        if fh is not None:
+            fh.close()
+        session, self._session = getattr(self, "_session", None), None
+        if session is not None:
+            session.close()
+
+    def _get_session(self) -> Any:
+        """Keep-alive session for api.x.com, retrying only rate-limit (429) responses."""
+
+        if self._session is None:
+            import requests  # type: ignore
+            from requests.adapters import HTTPAdapter  # type: ignore
+            from urllib3.util.retry import Retry  # type: ignore
+
+            session = requests.Session()
+            session.headers.update(
+                {"Authorization": f"Bearer {self.bearer_token}", "Content-Type": "application/json"}
+            )
+            # Only 429 is safe to retry: X rejected the request without creating the
+            # tweet. A 5xx may come back after the tweet was created upstream, so a
+            # retry would double-post (or hit the duplicate-content 403); those go
+            # to the queue like any other failure. Connect/read/other errors are not
+            # retried either: a POST that timed out may still have been created.
+            retry = Retry(
+                total=3,
+                connect=0,
+                read=0,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=(429,),
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            )
+            session.mount("https://", HTTPAdapter(max_retries=retry))
+            self._session = session
+        return self._session
 
     def can_post(self) -> bool:
         return bool(self.bearer_token)
@@ -54,16 +122,12 @@ class XPoster:
         if not self.can_post():
             self._queue("missing_credentials", payload, metadata)
             return PostResult(status="queued", detail="missing_credentials")
-        if requests is None:
+        if not _HAS_REQUESTS:
             self._queue("requests_missing", payload, metadata)
             return PostResult(status="queued", detail="requests_missing")
 
-        headers = {
-            "Authorization": f"Bearer {self.bearer_token}",
-            "Content-Type": "application/json",
-        }
         try:
-            resp = requests.post(self.API_URL, headers=headers, json=payload, timeout=30)
+            resp = self._get_session().post(self.API_URL, json=payload, timeout=self.TIMEOUT_S)
         except Exception as exc:  # pragma: no cover - network error path
             self._queue(f"error:{exc}", payload, metadata)
             return PostResult(status="queued", detail=f"network_error:{exc}")
@@ -86,8 +150,11 @@ class XPoster:
             "metadata": metadata,
             "queued_at_utc": _utcnow_iso(),
         }
-        with self.queue_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if self._queue_fh is None:
+            # Unbuffered: the queue is the record that a post was attempted, so a
+            # crashed run must not lose lines still sitting in a write buffer.
+            self._queue_fh = self.queue_path.open("ab", buffering=0)
+        self._queue_fh.write(_jsonl_line(record))
 
 
 __all__ = ["XPoster", "PostResult"]
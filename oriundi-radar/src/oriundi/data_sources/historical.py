@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import csv
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
 from typing import Iterable
 
@@ -25,14 +26,10 @@ class HistoricalRosterSource(DataSource):
         if not path.exists():
             return []
 
-        batch: RecordBatch = []
+        limit = max(self.settings.max_rows, 0)
         with path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for idx, row in enumerate(reader):
-                if idx >= max(self.settings.max_rows, 0):
-                    break
-                batch.append(self._build_record(row))
-
+            rows = islice(csv.DictReader(handle), limit)
+            batch: RecordBatch = [self._build_record(row) for row in rows]
         return [batch] if batch else []
 
     def _build_record(self, row: dict) -> dict:
@@ -30,33 +30,34 @@ class OpenRegistrySource(DataSource):
         try:
             url = f"{self.settings.base_url}?{parse.urlencode({'limit': self.settings.max_results})}"
             with self.opener.open(url, timeout=30) as response:
-                payload = response.read().decode("utf-8")
+                payload = response.read()
         except Exception as exc:  # pragma: no cover - network safety
             raise RuntimeError("Impossibile scaricare i registri open data") from exc
 
         try:
-            data = json.loads(payload)
-        except json.JSONDecodeError:  # pragma: no cover - data issues
+            import orjson  # type: ignore
+        except ImportError:  # pragma: no cover - optional dependency
+            loads = json.loads
+        else:
+            loads = orjson.loads
+
+        try:
+            data = loads(payload)
+        except ValueError:  # pragma: no cover - data issues
             return []
 
         records = data if isinstance(data, list) else data.get("results", [])
         if not isinstance(records, list):
             return []
 
-        enriched: RecordBatch = []
-        for item in records:
-            if not isinstance(item, dict):
-                continue
-            enriched.append(
-                {
-                    **item,
-                    "__metadata__": SourceMetadata(
-                        source="open_registry",
-                        retrieved_at=datetime.now(UTC),
-                        confidence=0.85,
-                    ),
-                }
-            )
+        metadata = SourceMetadata(
+            source="open_registry",
+            retrieved_at=datetime.now(UTC),
+            confidence=0.85,
+        )
+        enriched: RecordBatch = [
+            {**item, "__metadata__": metadata} for item in records if isinstance(item, dict)
+        ]
         return [enriched]
 
 
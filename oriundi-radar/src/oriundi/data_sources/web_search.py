@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Iterable, List, Optional
 from urllib import request
@@ -22,49 +23,77 @@ class AnyCrawlSearchSource(DataSource):
         opener: Optional[request.OpenerDirector] = None,
         pages: int = 1,
         limit: int = 20,
+        max_workers: int = 4,
     ) -> None:
         self.settings = settings
         self.queries = queries
         self.pages = pages
         self.limit = limit
+        self.max_workers = max_workers
         self.opener = opener or request.build_opener()
+        self._use_session = opener is None
 
     def fetch(self) -> Iterable[RecordBatch]:
-        batches: list[RecordBatch] = []
-        for query in self.queries:
-            payload = json.dumps({"query": query, "pages": self.pages, "limit": self.limit}).encode(
-                "utf-8"
-            )
-            req = request.Request(
-                f"{self.settings.base_url}/search",
-                data=payload,
-                headers=self._headers(),
-                method="POST",
-            )
-            try:
-                with self.opener.open(req, timeout=30) as response:
-                    data = json.loads(response.read().decode("utf-8"))
-            except Exception:  # pragma: no cover - network issues
-                continue
-            results = data.get("results", []) if isinstance(data, dict) else []
-            batch: RecordBatch = []
-            for item in results:
-                if not isinstance(item, dict):
-                    continue
-                batch.append(
-                    {
-                        **item,
-                        "__metadata__": SourceMetadata(
-                            source="anycrawl_search",
-                            retrieved_at=datetime.now(UTC),
-                            confidence=0.75,
-                        ),
-                    }
-                )
-            if batch:
-                batches.append(batch)
+        if not self.queries:
+            return []
+        session = self._open_session()
+        workers = max(1, min(self.max_workers, len(self.queries)))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(lambda query: self._search(session, query), self.queries)
+                batches: list[RecordBatch] = [batch for batch in results if batch]
+        finally:
+            if session is not None:
+                session.close()
         return batches
 
+    def _search(self, session, query: str) -> RecordBatch:
+        body = {"query": query, "pages": self.pages, "limit": self.limit}
+        try:
+            import orjson  # type: ignore
+        except ImportError:  # pragma: no cover - optional dependency
+            payload, loads = json.dumps(body).encode("utf-8"), json.loads
+        else:
+            payload, loads = orjson.dumps(body), orjson.loads
+        try:
+            data = loads(self._post(session, payload))
+        except Exception:  # pragma: no cover - network issues
+            return []
+        results = data.get("results", []) if isinstance(data, dict) else []
+        metadata = SourceMetadata(
+            source="anycrawl_search",
+            retrieved_at=datetime.now(UTC),
+            confidence=0.75,
+        )
+        return [{**item, "__metadata__": metadata} for item in results if isinstance(item, dict)]
+
+    def _open_session(self):
+        """Return a keep-alive ``requests`` session, or ``None`` to use the urllib opener."""
+
+        if not self._use_session:
+            return None
+        try:
+            import requests  # type: ignore
+            from requests.adapters import HTTPAdapter  # type: ignore
+        except ImportError:  # pragma: no cover - optional dependency
+            return None
+        session = requests.Session()
+        session.headers.update(self._headers())
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, self.max_workers))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _post(self, session, payload: bytes) -> bytes:
+        url = f"{self.settings.base_url}/search"
+        if session is not None:
+            response = session.post(url, data=payload, timeout=30)
+            response.raise_for_status()
+            return response.content
+        req = request.Request(url, data=payload, headers=self._headers(), method="POST")
+        with self.opener.open(req, timeout=30) as response:
+            return response.read()
+
     def _headers(self) -> dict:
         headers = {"Content-Type": "application/json"}
         if self.settings.key:
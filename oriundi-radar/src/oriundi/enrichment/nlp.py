@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Iterable, List
 
 from ..data_sources.base import RecordBatch
 from ..config import MLSettings
 
+_UNUSED_COMPONENTS = ("parser", "lemmatizer", "attribute_ruler")
+_PIPE_BATCH_SIZE = 64
+_GEO_LABELS = frozenset({"GPE", "NORP"})
+
 
 @dataclass
 class GeoEligibility:
@@ -29,32 +34,26 @@ class GeoEligibilityModel:
     def nlp(self):  # pragma: no cover - optional dependency
         if not self.settings.enable_language_models or not self.settings.spacy_model:
             return None
-        try:
-            import spacy
-        except ImportError as exc:  # pragma: no cover - optional import
-            raise RuntimeError(
-                "spaCy non installato. Installa l'extra 'full' per abilitare l'NLP."
-            ) from exc
-        return spacy.load(self.settings.spacy_model)
+        return _load_spacy(self.settings.spacy_model, _UNUSED_COMPONENTS)
 
     def infer(self, texts: Iterable[str]) -> List[GeoEligibility]:
         model = self.nlp
         if model is None:
             return []
-        results: List[GeoEligibility] = []
-        for doc in model.pipe(texts):  # type: ignore[union-attr]
-            entities = [ent for ent in doc.ents if ent.label_ in {"GPE", "NORP"}]
-            for ent in entities:
-                results.append(
-                    GeoEligibility(
-                        country=ent.text,
-                        score=min(1.0, 0.5 + (len(ent.text) / 20)),
-                        rationale=f"Entity {ent.text} ({ent.label_})",
-                    )
-                )
-        return results
+        return [
+            GeoEligibility(
+                country=ent.text,
+                score=min(1.0, 0.5 + (len(ent.text) / 20)),
+                rationale=f"Entity {ent.text} ({ent.label_})",
+            )
+            for doc in model.pipe(texts, batch_size=_PIPE_BATCH_SIZE)  # type: ignore[union-attr]
+            for ent in doc.ents
+            if ent.label_ in _GEO_LABELS
+        ]
 
     def annotate_batch(self, batch: RecordBatch) -> RecordBatch:
+        """Add batch-level geo evidence to each record in place."""
+
         if not batch:
             return []
         texts = [record.get("article.text", "") for record in batch if record.get("article.text")]
@@ -64,14 +63,31 @@ class GeoEligibilityModel:
             if evidence
             else 0.0
         )
-        notes = "; ".join(item.rationale for item in evidence)
-        annotated: RecordBatch = []
+        notes = _summarize_evidence(evidence)
         for record in batch:
-            updated = dict(record)
-            updated.setdefault("eligibility.geo_score", avg_score)
-            updated.setdefault("eligibility.geo_notes", notes)
-            annotated.append(updated)
-        return annotated
+            record.setdefault("eligibility.geo_score", avg_score)
+            record.setdefault("eligibility.geo_notes", notes)
+        return batch
+
+
+@lru_cache(maxsize=2)
+def _load_spacy(model_name: str, disable: tuple[str, ...]):  # pragma: no cover - optional dependency
+    """Load a spaCy pipeline once per process and share it across models."""
+
+    try:
+        import spacy
+    except ImportError as exc:  # pragma: no cover - optional import
+        raise RuntimeError(
+            "spaCy non installato. Installa l'extra 'full' per abilitare l'NLP."
+        ) from exc
+    return spacy.load(model_name, disable=list(disable))
+
+
+def _summarize_evidence(evidence: List[GeoEligibility], top: int = 3) -> str:
+    if not evidence:
+        return ""
+    countries = Counter(item.country for item in evidence).most_common(top)
+    return f"{len(evidence)} geo entities; top: {', '.join(country for country, _ in countries)}"
 
 
 __all__ = ["GeoEligibilityModel", "GeoEligibility"]
@@ -15,25 +15,25 @@ from ..data_sources.base import RecordBatch
 
 
 def enrich_with_social_signals(batches: Iterable[RecordBatch]) -> RecordBatch:
-    """Annotate candidates with synthetic social reach metrics."""
+    """Annotate candidates in place with synthetic social reach metrics."""
 
     enriched: RecordBatch = []
+    checked_at = datetime.now(UTC).isoformat(timespec="seconds")
     for batch in tqdm(list(batches), desc="social_enrichment", unit="batch"):
         for record in batch:
-            updated = dict(record)
-            full_name = str(updated.get("player.full_name", ""))
-            updated["social.last_check"] = datetime.now(UTC).isoformat(timespec="seconds")
-            updated["social.score"] = _heuristic_social_score(full_name)
-            enriched.append(updated)
+            full_name = str(record.get("player.full_name", ""))
+            record["social.last_check"] = checked_at
+            record["social.score"] = _heuristic_social_score(full_name)
+        enriched.extend(batch)
     return enriched
 
 
 def _heuristic_social_score(full_name: str) -> float:
     name = full_name.lower()
     base = 0.2 if len(name) < 5 else 0.4
-    if any(token in name for token in ("de ", "da ", "di ", "van ", "bin ")):
+    if "de " in name or "da " in name or "di " in name or "van " in name or "bin " in name:
         base += 0.1
-    vowels = sum(name.count(v) for v in "aeiou")
+    vowels = name.count("a") + name.count("e") + name.count("i") + name.count("o") + name.count("u")
     return round(min(1.0, base + (vowels / 20.0)), 3)
 
 
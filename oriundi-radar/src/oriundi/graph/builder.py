@@ -9,6 +9,12 @@ from ..data_sources.base import RecordBatch
 
 SCHEMA_PREFIX = "@prefix oriundi: <https://oriundi.ob1.dev/schema#> ."
 ENTITY_PREFIX = "@prefix entity: <https://oriundi.ob1.dev/entity/> ."
+NODE_PREDICATES = (
+    ("label", "oriundi:label"),
+    ("birth_date", "oriundi:birthDate"),
+    ("birth_place", "oriundi:birthPlace"),
+    ("current_club", "oriundi:currentClub"),
+)
 
 
 def build_graph(records: RecordBatch) -> Dict[str, List[dict]]:
@@ -16,8 +22,9 @@ def build_graph(records: RecordBatch) -> Dict[str, List[dict]]:
     edges: List[dict] = []
     for record in records:
         node_id = record.get("entity.cluster_id") or record.get("player.full_name", "anon")
-        if node_id not in nodes:
-            nodes[node_id] = {
+        node = nodes.get(node_id)
+        if node is None:
+            node = nodes[node_id] = {
                 "uri": f"entity:{node_id}",
                 "label": record.get("entity.canonical_name") or record.get("player.full_name", ""),
                 "birth_date": record.get("player.birth_date"),
@@ -28,7 +35,7 @@ def build_graph(records: RecordBatch) -> Dict[str, List[dict]]:
         if article_url:
             edges.append(
                 {
-                    "source": f"entity:{node_id}",
+                    "source": node["uri"],
                     "target": f"<{article_url}>",
                     "predicate": "oriundi:mentionedIn",
                 }
@@ -37,27 +44,17 @@ def build_graph(records: RecordBatch) -> Dict[str, List[dict]]:
 
 
 def export_graph(graph: Dict[str, List[dict]], destination: Path) -> None:
-    lines: List[str] = [SCHEMA_PREFIX, ENTITY_PREFIX, ""]
-    for node in graph.get("nodes", []):
-        uri = node["uri"]
-        lines.append(f"{uri} a oriundi:Player ;")
-        if node.get("label"):
-            lines.append(f'    oriundi:label "{node["label"]}" ;')
-        if node.get("birth_date"):
-            lines.append(f'    oriundi:birthDate "{node["birth_date"]}" ;')
-        if node.get("birth_place"):
-            lines.append(f'    oriundi:birthPlace "{node["birth_place"]}" ;')
-        if node.get("current_club"):
-            lines.append(f'    oriundi:currentClub "{node["current_club"]}" ;')
-        if lines[-1].endswith(";"):
-            lines[-1] = lines[-1][:-1] + "."
-        else:
-            lines.append(".")
-        lines.append("")
-    for edge in graph.get("edges", []):
-        lines.append(f"{edge['source']} {edge['predicate']} {edge['target']} .")
     destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_text("\n".join(lines), encoding="utf-8")
+    with destination.open("w", encoding="utf-8") as handle:
+        handle.write(f"{SCHEMA_PREFIX}\n{ENTITY_PREFIX}\n")
+        for node in graph.get("nodes", []):
+            statements = [f"{node['uri']} a oriundi:Player"]
+            statements.extend(
+                f'    {predicate} "{node[key]}"' for key, predicate in NODE_PREDICATES if node.get(key)
+            )
+            handle.write("\n" + " ;\n".join(statements) + " .\n")
+        for edge in graph.get("edges", []):
+            handle.write(f"\n{edge['source']} {edge['predicate']} {edge['target']} .")
 
 
 __all__ = ["build_graph", "export_graph"]
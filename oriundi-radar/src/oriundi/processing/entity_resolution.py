@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import List
+from typing import Callable, List
 
 from ..data_sources.base import RecordBatch
 
@@ -19,32 +19,39 @@ class ResolutionResult:
 
 
 def resolve_candidates(records: RecordBatch, threshold: int = 90) -> RecordBatch:
-    """Perform simple clustering using difflib ratio."""
+    """Cluster records whose names are similar, transitively (RapidFuzz when available, else difflib).
+
+    Records are annotated in place and returned grouped by cluster.
+    """
 
     if not records:
         return []
-    visited: set[int] = set()
-    clusters: list[ResolutionResult] = []
-    for idx, record in enumerate(records):
-        if idx in visited:
-            continue
-        canonical = record.get("player.full_name", "").strip()
-        members = [idx]
-        for other_idx in range(idx + 1, len(records)):
-            if other_idx in visited:
+    similarity = _load_scorer()
+    names = [record.get("player.full_name", "").strip() for record in records]
+    lowered = [name.lower() for name in names]
+    lengths = [len(name) for name in lowered]
+    by_length = sorted((idx for idx, name in enumerate(lowered) if name), key=lengths.__getitem__)
+    sets = _DisjointSet(len(records))
+    for pos, idx in enumerate(by_length):
+        length = lengths[idx]
+        for other_idx in by_length[pos + 1 :]:
+            if 200 * length < threshold * (length + lengths[other_idx]):
+                break
+            if sets.find(idx) == sets.find(other_idx):
                 continue
-            other_name = records[other_idx].get("player.full_name", "").strip()
-            if not other_name:
-                continue
-            score = SequenceMatcher(None, canonical.lower(), other_name.lower()).ratio() * 100
-            if score >= threshold:
-                members.append(other_idx)
-                visited.add(other_idx)
-                canonical = _merge_names(canonical, other_name)
-        visited.add(idx)
+            first, second = (idx, other_idx) if idx < other_idx else (other_idx, idx)
+            if similarity(lowered[first], lowered[second], threshold) >= threshold:
+                sets.union(idx, other_idx)
+
+    groups: dict[int, list[int]] = {}
+    for idx in range(len(records)):
+        groups.setdefault(sets.find(idx), []).append(idx)
+    clusters: list[ResolutionResult] = []
+    for members in groups.values():
+        canonical = _merge_names(*(names[member_idx] for member_idx in members))
         clusters.append(
             ResolutionResult(
-                canonical_name=canonical or record.get("player.full_name", ""),
+                canonical_name=canonical or records[members[0]].get("player.full_name", ""),
                 score=1.0,
                 members=members,
             )
@@ -52,17 +59,60 @@ def resolve_candidates(records: RecordBatch, threshold: int = 90) -> RecordBatch
     resolved: RecordBatch = []
     for cluster_idx, cluster in enumerate(clusters, start=1):
         for member_idx in cluster.members:
-            updated = dict(records[member_idx])
-            updated["entity.canonical_name"] = cluster.canonical_name
-            updated["entity.cluster_id"] = f"C{cluster_idx:03d}"
-            updated["entity.cluster_size"] = len(cluster.members)
-            resolved.append(updated)
+            record = records[member_idx]
+            record["entity.canonical_name"] = cluster.canonical_name
+            record["entity.cluster_id"] = f"C{cluster_idx:03d}"
+            record["entity.cluster_size"] = len(cluster.members)
+            resolved.append(record)
     return resolved
 
 
-def _merge_names(name_a: str, name_b: str) -> str:
-    parts = set(filter(None, (name_a or "").split() + (name_b or "").split()))
-    return " ".join(sorted(parts))
+class _DisjointSet:
+    """Union-find over record indices (union by rank, path halving)."""
+
+    __slots__ = ("parent", "rank")
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+        self.rank = [0] * size
+
+    def find(self, idx: int) -> int:
+        parent = self.parent
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    def union(self, idx_a: int, idx_b: int) -> None:
+        root_a, root_b = self.find(idx_a), self.find(idx_b)
+        if root_a == root_b:
+            return
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+
+
+def _load_scorer() -> Callable[[str, str, float], float]:
+    """Return a 0-100 similarity function that may report 0 below ``cutoff``."""
+
+    try:
+        from rapidfuzz.fuzz import ratio  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        return _difflib_ratio
+    return lambda name_a, name_b, cutoff: ratio(name_a, name_b, score_cutoff=cutoff)
+
+
+def _difflib_ratio(name_a: str, name_b: str, cutoff: float) -> float:
+    matcher = SequenceMatcher(None, name_a, name_b)
+    if matcher.real_quick_ratio() * 100 < cutoff or matcher.quick_ratio() * 100 < cutoff:
+        return 0.0
+    return matcher.ratio() * 100
+
+
+def _merge_names(*names: str) -> str:
+    return " ".join(dict.fromkeys(token for name in names for token in name.split()))
 
 
 __all__ = ["resolve_candidates", "ResolutionResult"]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import re
+from datetime import UTC, date, datetime
 from typing import Iterable, List
 
 from ..data_sources.base import RecordBatch
@@ -16,25 +17,27 @@ EXPECTED_KEYS = {
     "article.url",
     "article.text",
 }
+_EMPTY_RECORD = dict.fromkeys(EXPECTED_KEYS)
+_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
 
 
 def normalize_candidates(batches: Iterable[RecordBatch]) -> RecordBatch:
     """Normalize heterogenous batches into a canonical schema."""
 
     normalized: RecordBatch = []
+    batch_at = datetime.now(UTC).isoformat(timespec="seconds")
     for batch in batches:
         for record in batch:
-            normalized.append(_normalize_record(record))
+            normalized.append(_normalize_record(record, batch_at))
     return normalized
 
 
-def _normalize_record(record: dict) -> dict:
-    normalized = {key: record.get(key) for key in EXPECTED_KEYS}
-    normalized["player.full_name"] = _clean_name(normalized.get("player.full_name") or "")
-    normalized["player.birth_date"] = _parse_date(normalized.get("player.birth_date"))
-    normalized["article.url"] = (normalized.get("article.url") or "").strip()
-    normalized["ingestion.batch_at"] = datetime.now(UTC).isoformat(timespec="seconds")
-    normalized.update({k: v for k, v in record.items() if k not in normalized})
+def _normalize_record(record: dict, batch_at: str) -> dict:
+    normalized = {**_EMPTY_RECORD, **record}
+    normalized["player.full_name"] = _clean_name(normalized["player.full_name"] or "")
+    normalized["player.birth_date"] = _parse_date(normalized["player.birth_date"])
+    normalized["article.url"] = (normalized["article.url"] or "").strip()
+    normalized["ingestion.batch_at"] = batch_at
     return normalized
 
 
@@ -48,6 +51,11 @@ def _parse_date(value):
     if isinstance(value, datetime):
         return value.date().isoformat()
     if isinstance(value, str):
+        if _ISO_DATE.fullmatch(value):
+            try:
+                return date.fromisoformat(value).isoformat()
+            except ValueError:
+                return None
         for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y"):
             try:
                 return datetime.strptime(value, fmt).date().isoformat()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from oriundi.processing import resolve_candidates
+
+
+def _clusters(records):
+    groups: dict[str, list[str]] = {}
+    for record in records:
+        groups.setdefault(record["entity.cluster_id"], []).append(record["player.full_name"])
+    return sorted(sorted(names) for names in groups.values())
+
+
+def test_resolve_candidates_clusters_transitively_regardless_of_order() -> None:
+    names = ["Marco De Rossi", "Marco De Rosso", "Marko De Rosso", "Giulio Verdi"]
+    expected = [["Giulio Verdi"], ["Marco De Rossi", "Marco De Rosso", "Marko De Rosso"]]
+
+    for ordering in (names, list(reversed(names)), [names[0], names[2], names[3], names[1]]):
+        resolved = resolve_candidates([{"player.full_name": name} for name in ordering], threshold=90)
+        assert _clusters(resolved) == expected
+
+    resolved = resolve_candidates([{"player.full_name": name} for name in names], threshold=90)
+    sizes = {record["player.full_name"]: record["entity.cluster_size"] for record in resolved}
+    assert sizes == {"Marco De Rossi": 3, "Marco De Rosso": 3, "Marko De Rosso": 3, "Giulio Verdi": 1}
+    assert [record["entity.cluster_id"] for record in resolved] == ["C001", "C001", "C001", "C002"]
+    assert resolved[0]["entity.canonical_name"] == "Marco De Rossi Rosso Marko"
+
+
+def test_resolve_candidates_keeps_blank_names_apart() -> None:
+    resolved = resolve_candidates([{"player.full_name": ""}, {"player.full_name": " "}, {}])
+
+    assert [record["entity.cluster_id"] for record in resolved] == ["C001", "C002", "C003"]
+    assert all(record["entity.cluster_size"] == 1 for record in resolved)
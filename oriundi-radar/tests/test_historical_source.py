@@ -28,3 +28,23 @@ Giulio Verdi,1999-01-20,Roma,Latina Calcio,DF,Senior,2023-10-12,San Marino vs. N
     assert record["player.full_name"] == "Giulio Verdi"
     assert record["fsgc.team_level"] == "Senior"
     assert record["__metadata__"].source == "historical_callups"
+
+
+def test_historical_roster_source_keeps_dict_reader_semantics(tmp_path: Path) -> None:
+    csv_path = tmp_path / "callups.csv"
+    csv_path.write_text(
+        "player_name,position,position,source_url,scouting_notes\n"
+        '#Giulio Verdi,DF,MF,,"x\\"y"\n'
+        "Marco Bianchi,FW,FW,https://example.org,\n",
+        encoding="utf-8",
+    )
+    source = HistoricalRosterSource(HistoricalRosterSettings(enabled=True, path=csv_path, max_rows=1))
+
+    (batch,) = source.fetch()
+
+    assert len(batch) == 1
+    record = batch[0]
+    assert record["player.full_name"] == "#Giulio Verdi"
+    assert record["player.position"] == "MF"
+    assert record["article.url"] == ""
+    assert record["article.text"] == 'x\\y"'
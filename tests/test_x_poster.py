@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+pytest.importorskip("requests")
+
+from engine.x_poster import XPoster
+
+
+class _Handler(BaseHTTPRequestHandler):
+    statuses: List[int] = []
+    delay_s = 0.0
+    hits = 0
+    url = ""
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server hook
+        type(self).hits += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.delay_s)
+        status = self.statuses.pop(0) if self.statuses else 201
+        body = b'{"data": {"id": "1"}}'
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture()
+def server() -> Iterator[type[_Handler]]:
+    handler = type("Handler", (_Handler,), {"statuses": [], "delay_s": 0.0, "hits": 0})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    handler.url = f"http://127.0.0.1:{httpd.server_address[1]}/2/tweets"
+    yield handler
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _poster(tmp_path: Path, url: str) -> XPoster:
+    poster = XPoster(bearer_token="token", queue_path=tmp_path / "x_queue.jsonl")
+    poster.API_URL = url
+    poster.TIMEOUT_S = 0.3
+    session = poster._get_session()
+    # The test server speaks plain HTTP; give it the same retrying adapter as api.x.com.
+    session.mount("http://", session.get_adapter("https://api.x.com"))
+    return poster
+
+
+def test_post_is_not_retried_after_read_timeout(tmp_path: Path, server) -> None:
+    server.delay_s = 1.0
+    with _poster(tmp_path, server.url) as poster:
+        result = poster.post("ciao")
+
+    assert result.status == "queued"
+    assert server.hits == 1
+    assert (tmp_path / "x_queue.jsonl").read_text(encoding="utf-8").count("\n") == 1
+
+
+def test_post_is_retried_on_rate_limit(tmp_path: Path, server) -> None:
+    server.statuses = [429, 429]
+    with _poster(tmp_path, server.url) as poster:
+        result = poster.post("ciao")
+
+    assert result.status == "posted"
+    assert server.hits == 3